@@ -161,10 +161,9 @@ export default function Performance() {
                     data: endpointPerformance.endpoints
                         .slice(0, 10)
                         .map((ep) => {
-                            // Parse response time string like "0.0050s" to number
-                            const timeStr = ep.avg_response_time || ep.average_response_time || '0s';
-                            const timeValue = parseFloat(timeStr.replace('s', ''));
-                            return timeValue;
+                            // Accept numeric seconds or strings like "0.0050s" (parseFloat stops at the unit)
+                            const time = ep.avg_response_time || ep.average_response_time || 0;
+                            return typeof time === 'number' ? time : parseFloat(time) || 0;
                         }),
                     backgroundColor: 'rgba(59, 130, 246, 0.8)',
                 },
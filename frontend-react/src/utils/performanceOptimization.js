@@ -112,21 +112,38 @@ export const areArraysEqual = (arr1, arr2) => {
 
 /**
  * Memoization helper for expensive computations
- * 
+ * When maxSize is given, the cache evicts the least recently used entry
+ * (Map keeps insertion order, so re-inserting a hit marks it most recent).
+ * A maxSize of 0 or less disables caching.
+ *
  * @param {Function} fn - Function to memoize
+ * @param {number} [maxSize=Infinity] - Maximum number of cached results
  * @returns {Function} - Memoized function
  */
-export const memoize = (fn) => {
+export const memoize = (fn, maxSize = Infinity) => {
+    if (maxSize <= 0) {
+        return (...args) => fn(...args);
+    }
+
     const cache = new Map();
 
     return (...args) => {
         const key = JSON.stringify(args);
 
-        if (cache.has(key)) {
-            return cache.get(key);
+        // Unbounded hits cost a single lookup; has() only separates a miss from a cached undefined
+        const cached = cache.get(key);
+        if (cached !== undefined || cache.has(key)) {
+            if (maxSize !== Infinity) {
+                cache.delete(key);
+                cache.set(key, cached);
+            }
+            return cached;
         }
 
         const result = fn(...args);
+        if (cache.size >= maxSize) {
+            cache.delete(cache.keys().next().value);
+        }
         cache.set(key, result);
         return result;
     };
@@ -0,0 +1,78 @@
+/**
+ * Performance Optimization Utilities Tests
+ * 
+ * Requirements: 17.1-17.6
+ */
+
+import { describe, it, expect, vi } from 'vitest';
+import { memoize } from './performanceOptimization';
+
+describe('Performance Optimization Utilities', () => {
+    describe('memoize', () => {
+        it('should stay unbounded without maxSize', () => {
+            const fn = vi.fn((x) => x * 2);
+            const memoized = memoize(fn);
+
+            for (let i = 0; i < 100; i++) {
+                memoized(i);
+            }
+            for (let i = 0; i < 100; i++) {
+                expect(memoized(i)).toBe(i * 2);
+            }
+
+            expect(fn).toHaveBeenCalledTimes(100);
+        });
+
+        it('should treat a cached undefined result as a hit', () => {
+            const fn = vi.fn(() => undefined);
+            const memoized = memoize(fn);
+
+            expect(memoized(1)).toBe(undefined);
+            expect(memoized(1)).toBe(undefined);
+            expect(fn).toHaveBeenCalledTimes(1);
+        });
+
+        it('should evict the least recently used entry when full', () => {
+            const fn = vi.fn((x) => x * 2);
+            const memoized = memoize(fn, 2);
+
+            memoized(1);
+            memoized(2);
+            memoized(3); // evicts 1
+            expect(fn).toHaveBeenCalledTimes(3);
+
+            memoized(2);
+            memoized(3);
+            expect(fn).toHaveBeenCalledTimes(3);
+
+            memoized(1);
+            expect(fn).toHaveBeenCalledTimes(4);
+        });
+
+        it('should mark a hit as most recently used', () => {
+            const fn = vi.fn((x) => x * 2);
+            const memoized = memoize(fn, 2);
+
+            memoized(1);
+            memoized(2);
+            memoized(1); // hit, 2 is now least recently used
+            memoized(3); // evicts 2
+            expect(fn).toHaveBeenCalledTimes(3);
+
+            memoized(1);
+            expect(fn).toHaveBeenCalledTimes(3);
+
+            memoized(2);
+            expect(fn).toHaveBeenCalledTimes(4);
+        });
+
+        it('should not cache when maxSize is 0 or less', () => {
+            const fn = vi.fn((x) => x * 2);
+            const memoized = memoize(fn, 0);
+
+            expect(memoized(1)).toBe(2);
+            expect(memoized(1)).toBe(2);
+            expect(fn).toHaveBeenCalledTimes(2);
+        });
+    });
+});
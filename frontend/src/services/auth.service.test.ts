@@ -260,6 +260,18 @@ describe('AuthService', () => {
             expect(authService.getTokenExpiration()).toBeNull();
         });
 
+        it('should reflect a new token after the previous one was decoded', () => {
+            const firstExpTime = Math.floor(Date.now() / 1000) + 3600;
+            const secondExpTime = firstExpTime + 3600;
+
+            authService.setToken(createMockToken(firstExpTime));
+            expect(authService.getTokenExpiration()).toBe(firstExpTime);
+            expect(authService.getTokenExpiration()).toBe(firstExpTime);
+
+            authService.setToken(createMockToken(secondExpTime));
+            expect(authService.getTokenExpiration()).toBe(secondExpTime);
+        });
+
         it('should calculate time remaining until expiration', () => {
             const expTime = Math.floor(Date.now() / 1000) + 3600;
             const token = createMockToken(expTime);
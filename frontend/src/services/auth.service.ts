@@ -46,6 +46,10 @@ class AuthService {
     private readonly TOKEN_KEY = 'token';
     private readonly TOKEN_EXPIRY_BUFFER = 60; // 60 seconds buffer before expiry
 
+    // Last decoded token and its payload; guards re-check the same token on every navigation
+    private decodedToken: string | null = null;
+    private decodedPayload: TokenPayload | null = null;
+
     /**
      * Login user with credentials
      * @param credentials - User login credentials
@@ -201,6 +205,21 @@ class AuthService {
      * @returns Decoded token payload
      */
     private decodeToken(token: string): TokenPayload | null {
+        if (token === this.decodedToken) {
+            return this.decodedPayload;
+        }
+
+        this.decodedToken = token;
+        this.decodedPayload = this.parseTokenPayload(token);
+        return this.decodedPayload;
+    }
+
+    /**
+     * Parse the payload segment of a JWT token
+     * @param token - JWT token string
+     * @returns Parsed token payload, or null if the token is malformed
+     */
+    private parseTokenPayload(token: string): TokenPayload | null {
         try {
             // JWT structure: header.payload.signature
             const parts = token.split('.');